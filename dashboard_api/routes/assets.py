@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple
 import os
 import shutil
 import subprocess
+import tempfile
 import json
 from pathlib import Path
 from datetime import datetime
@@ -75,6 +76,25 @@ except OSError as e:
         print(f"Warning: Could not create fallback directories: {e2}")
 
 
+def _thumbnail_is_fresh(thumb_path: str, video_path: str) -> bool:
+    """Check whether an existing, non-empty thumbnail is at least as new as its video.
+
+    Args:
+        thumb_path: Path to the thumbnail JPEG.
+        video_path: Path to the source video file.
+
+    Returns:
+        bool: True if the thumbnail can be reused without running ffmpeg.
+    """
+    try:
+        return (
+            os.path.getsize(thumb_path) > 0
+            and os.path.getmtime(thumb_path) >= os.path.getmtime(video_path)
+        )
+    except OSError:
+        return False
+
+
 @router.get("/stats", response_model=dict)
 async def get_asset_stats(current_user=Depends(get_current_user), db: Session = Depends(get_db)):
     """Get video asset statistics."""
@@ -666,25 +686,36 @@ async def validate_asset(
 
             asset.is_valid = True
             asset.validation_errors = None
-            # Generate thumbnail (optional)
+            # Generate thumbnail (optional), reusing one that is newer than the video
             try:
                 thumb_path = os.path.join(THUMBNAILS_DIR, f"{os.path.splitext(asset.filename)[0]}.jpg")
-                subprocess.run(
-                    [
-                        "ffmpeg",
-                        "-y",
-                        "-i",
-                        asset.file_path,
-                        "-frames:v",
-                        "1",
-                        "-q:v",
-                        "2",
-                        thumb_path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
+                if not _thumbnail_is_fresh(thumb_path, asset.file_path):
+                    # Render to a temp file so a killed or failed ffmpeg never
+                    # leaves a partial JPEG at thumb_path
+                    fd, tmp_thumb = tempfile.mkstemp(suffix=".jpg", dir=THUMBNAILS_DIR)
+                    os.close(fd)
+                    try:
+                        thumb_result = subprocess.run(
+                            [
+                                "ffmpeg",
+                                "-y",
+                                "-i",
+                                asset.file_path,
+                                "-frames:v",
+                                "1",
+                                "-q:v",
+                                "2",
+                                tmp_thumb,
+                            ],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            timeout=30,
+                        )
+                        if thumb_result.returncode == 0:
+                            os.replace(tmp_thumb, thumb_path)
+                    finally:
+                        if os.path.exists(tmp_thumb):
+                            os.remove(tmp_thumb)
                 if os.path.exists(thumb_path):
                     asset.thumbnail_path = thumb_path
             except Exception:
@@ -7,7 +7,9 @@ from typing import List, Optional
 import csv
 import json
 import io
+import os
 from datetime import datetime
+from pathlib import Path
 
 from database import get_db
 from dependencies import get_current_user, require_operator
@@ -132,7 +134,6 @@ async def list_mappings(
         # Prefer filename; fall back to basename(loop_file_path)
         db_filename = row[2]
         if not db_filename and row[3]:
-            import os
             db_filename = os.path.basename(row[3])
 
         mappings.append(
@@ -259,7 +260,6 @@ async def get_mapping(
     # Prefer filename; fall back to basename(loop_file_path)
     db_filename = result[2]
     if not db_filename and result[3]:
-        import os
         db_filename = os.path.basename(result[3])
 
     return {
@@ -298,8 +298,7 @@ async def create_mapping(
 
     # Insert mapping
     # Resolve absolute path for back-compat storage
-    from pathlib import Path as _Path
-    abs_path = str(_Path(settings.loops_path) / mapping_data.filename)
+    abs_path = str(Path(settings.loops_path) / mapping_data.filename)
 
     result = db.execute(
         text(
@@ -383,8 +382,7 @@ async def update_mapping(
     track_key = f"{mapping_data.artist} - {mapping_data.title}"
 
     # Resolve absolute path for back-compat storage
-    from pathlib import Path as _Path
-    abs_path = str(_Path(settings.loops_path) / mapping_data.filename)
+    abs_path = str(Path(settings.loops_path) / mapping_data.filename)
 
     # Update mapping
     db.execute(
@@ -468,6 +466,48 @@ async def delete_mapping(
     )
 
 
+# Rows per multi-row INSERT during bulk import
+BULK_IMPORT_BATCH_SIZE = 1000
+
+
+def _bulk_insert_mappings(db: Session, rows: List[dict]) -> dict:
+    """Insert track mappings in multi-row batches, skipping existing track keys.
+
+    Args:
+        db: Database session.
+        rows: Insert parameters keyed by column name (track_key, filename,
+            loop_file_path, azuracast_song_id, notes).
+
+    Returns:
+        dict: Mapping id by track_key for each row that was inserted.
+    """
+    inserted = {}
+    for start in range(0, len(rows), BULK_IMPORT_BATCH_SIZE):
+        batch = rows[start : start + BULK_IMPORT_BATCH_SIZE]
+        values = []
+        params = {}
+        for n, row in enumerate(batch):
+            values.append(
+                f"(:track_key_{n}, :filename_{n}, :loop_file_path_{n}, "
+                f":azuracast_song_id_{n}, :notes_{n}, CURRENT_TIMESTAMP, 0)"
+            )
+            params.update({f"{column}_{n}": value for column, value in row.items()})
+
+        result = db.execute(
+            text(
+                "INSERT INTO track_mappings "
+                "(track_key, filename, loop_file_path, azuracast_song_id, notes, created_at, play_count) "
+                f"VALUES {', '.join(values)} "
+                "ON CONFLICT (track_key) DO NOTHING "
+                "RETURNING id, track_key"
+            ),
+            params,
+        )
+        inserted.update({track_key: mapping_id for mapping_id, track_key in result.fetchall()})
+
+    return inserted
+
+
 @router.post("/bulk-import")
 async def bulk_import_mappings(
     request: Request,
@@ -477,6 +517,9 @@ async def bulk_import_mappings(
 ):
     """Bulk import track mappings from CSV or JSON.
 
+    Rows are inserted in batches; rows whose track key already exists (in the
+    database or earlier in the file) are reported in ``errors``.
+
     Args:
         request: FastAPI request.
         file: Uploaded file (CSV or JSON).
@@ -496,70 +539,47 @@ async def bulk_import_mappings(
         if file.filename.endswith(".csv"):
             # Parse CSV
             reader = csv.DictReader(io.StringIO(content_str))
-
-            for i, row in enumerate(reader, start=1):
-                try:
-                    track_key = f"{row.get('artist', '')} - {row.get('title', '')}"
-                    filename = row.get('filename') or row.get('video_loop') or ''
-                    from pathlib import Path as _Path
-                    abs_path = str(_Path(settings.loops_path) / filename) if filename else ''
-                    result = db.execute(
-                        text(
-                            """
-                        INSERT INTO track_mappings 
-                        (track_key, filename, loop_file_path, azuracast_song_id, notes, created_at, play_count)
-                        VALUES (:track_key, :filename, :loop_file_path, :azuracast_song_id, :notes, NOW(), 0)
-                        RETURNING id
-                        """
-                        ),
-                        {
-                            "track_key": track_key,
-                            "filename": filename,
-                            "loop_file_path": abs_path,
-                            "azuracast_song_id": row.get("azuracast_song_id"),
-                            "notes": row.get("notes"),
-                        },
-                    )
-                    imported.append(result.fetchone()[0])
-                except Exception as e:
-                    errors.append(f"Row {i}: {str(e)}")
+            entries = [(f"Row {i}", row) for i, row in enumerate(reader, start=1)]
 
         elif file.filename.endswith(".json"):
             # Parse JSON
             data = json.loads(content_str)
-
-            for i, item in enumerate(data, start=1):
-                try:
-                    track_key = f"{item.get('artist', '')} - {item.get('title', '')}"
-                    filename = item.get('filename') or item.get('video_loop') or ''
-                    from pathlib import Path as _Path
-                    abs_path = str(_Path(settings.loops_path) / filename) if filename else ''
-                    result = db.execute(
-                        text(
-                            """
-                        INSERT INTO track_mappings 
-                        (track_key, filename, loop_file_path, azuracast_song_id, notes, created_at, play_count)
-                        VALUES (:track_key, :filename, :loop_file_path, :azuracast_song_id, :notes, NOW(), 0)
-                        RETURNING id
-                        """
-                        ),
-                        {
-                            "track_key": track_key,
-                            "filename": filename,
-                            "loop_file_path": abs_path,
-                            "azuracast_song_id": item.get("azuracast_song_id"),
-                            "notes": item.get("notes"),
-                        },
-                    )
-                    imported.append(result.fetchone()[0])
-                except Exception as e:
-                    errors.append(f"Item {i}: {str(e)}")
+            entries = [(f"Item {i}", item) for i, item in enumerate(data, start=1)]
 
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="File must be CSV or JSON"
             )
 
+        # Build insert parameters; the first row for a track key wins
+        pending = {}
+        labels = {}
+        for label, item in entries:
+            try:
+                track_key = f"{item.get('artist', '')} - {item.get('title', '')}"
+                if track_key in pending:
+                    errors.append(f"{label}: duplicate of {labels[track_key]} ({track_key})")
+                    continue
+                filename = item.get('filename') or item.get('video_loop') or ''
+                abs_path = str(Path(settings.loops_path) / filename) if filename else ''
+                pending[track_key] = {
+                    "track_key": track_key,
+                    "filename": filename,
+                    "loop_file_path": abs_path,
+                    "azuracast_song_id": item.get("azuracast_song_id"),
+                    "notes": item.get("notes"),
+                }
+                labels[track_key] = label
+            except Exception as e:
+                errors.append(f"{label}: {str(e)}")
+
+        inserted = _bulk_insert_mappings(db, list(pending.values()))
+        for track_key, label in labels.items():
+            if track_key in inserted:
+                imported.append(inserted[track_key])
+            else:
+                errors.append(f"{label}: mapping already exists ({track_key})")
+
         db.commit()
 
         # Log action
@@ -648,20 +668,20 @@ async def export_mappings(current_user=Depends(get_current_user), db: Session =
         )
     ).fetchall()
 
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["artist", "title", "filename", "azuracast_song_id", "notes", "play_count"])
-
-    for row in result:
+    def _csv_row(row) -> list:
         track_parts = row[0].split(" - ", 1) if row[0] else ["Unknown", "Unknown"]
         artist = track_parts[0] if len(track_parts) > 0 else "Unknown"
         title = track_parts[1] if len(track_parts) > 1 else track_parts[0]
         # Prefer filename; if NULL, fallback to basename of loop_file_path
         filename = row[1]
         if not filename and row[2]:
-            import os
             filename = os.path.basename(row[2])
-        writer.writerow([artist, title, filename, row[3], row[4], row[5]])
+        return [artist, title, filename, row[3], row[4], row[5]]
+
+    # Generate CSV (writerows consumes the generator in one call)
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["artist", "title", "filename", "azuracast_song_id", "notes", "play_count"])
+    writer.writerows(_csv_row(row) for row in result)
 
     return {"csv_data": output.getvalue(), "row_count": len(result)}
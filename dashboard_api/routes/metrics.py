@@ -43,21 +43,19 @@ async def get_current_metrics(
     stream_pid = None
     stream_uptime = 0
 
-    # Get tracks played today
-    tracks_today_result = db.execute(
+    # Get tracks played today and total mappings in one scan
+    track_counts = db.execute(
         text(
             """
-        SELECT COUNT(*) 
-        FROM track_mappings 
-        WHERE last_played_at >= CURRENT_DATE
+        SELECT
+            COUNT(*) FILTER (WHERE last_played_at >= CURRENT_DATE),
+            COUNT(*)
+        FROM track_mappings
         """
         )
     ).fetchone()
-    tracks_today = tracks_today_result[0] if tracks_today_result else 0
-
-    # Get total mappings
-    total_mappings_result = db.execute(text("SELECT COUNT(*) FROM track_mappings")).fetchone()
-    total_mappings = total_mappings_result[0] if total_mappings_result else 0
+    tracks_today = track_counts[0] if track_counts else 0
+    total_mappings = track_counts[1] if track_counts else 0
 
     return {
         "timestamp": datetime.utcnow().isoformat(),
@@ -150,27 +148,18 @@ async def get_metrics_summary(
         )
     ).fetchone()
 
-    # Recent activity count
-    recent_activity = db.execute(
+    # Recent activity (24h) and active users (7d) in one pass over the last week
+    recent_activity, active_users = db.execute(
         text(
             """
-        SELECT COUNT(*)
-        FROM audit_log
-        WHERE timestamp >= NOW() - INTERVAL '24 hours'
-        """
-        )
-    ).fetchone()[0]
-
-    # Active users count
-    active_users = db.execute(
-        text(
-            """
-        SELECT COUNT(DISTINCT user_id)
+        SELECT
+            COUNT(*) FILTER (WHERE timestamp >= NOW() - INTERVAL '24 hours'),
+            COUNT(DISTINCT user_id)
         FROM audit_log
         WHERE timestamp >= NOW() - INTERVAL '7 days'
         """
         )
-    ).fetchone()[0]
+    ).fetchone()
 
     # Parse most played if exists
     most_played_data = None
@@ -2,6 +2,9 @@
 
 import io
 import json
+import os
+
+from dashboard_api.routes.assets import _thumbnail_is_fresh
 
 def test_upload_list_update_delete_asset(client, auth_headers):
     # Upload a fake mp4
@@ -44,4 +47,17 @@ def test_upload_list_update_delete_asset(client, auth_headers):
     assert r.status_code in (200, 204)
 
 
+def _write(path, content: bytes, mtime: float) -> str:
+    path.write_bytes(content)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_thumbnail_is_fresh(tmp_path):
+    video = _write(tmp_path / "loop.mp4", b"video", 1_000)
 
+    assert _thumbnail_is_fresh(_write(tmp_path / "fresh.jpg", b"jpeg", 2_000), video)
+    assert _thumbnail_is_fresh(_write(tmp_path / "same.jpg", b"jpeg", 1_000), video)
+    assert not _thumbnail_is_fresh(_write(tmp_path / "stale.jpg", b"jpeg", 500), video)
+    assert not _thumbnail_is_fresh(_write(tmp_path / "empty.jpg", b"", 2_000), video)
+    assert not _thumbnail_is_fresh(str(tmp_path / "missing.jpg"), video)
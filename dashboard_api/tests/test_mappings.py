@@ -0,0 +1,93 @@
+"""Tests for mappings API."""
+
+import io
+import json
+
+import pytest
+from sqlalchemy import event, text
+
+
+@pytest.fixture
+def mappings_table(db_session):
+    """Create track_mappings, which is managed by SQL migrations rather than ORM models."""
+    db_session.execute(
+        text(
+            """
+        CREATE TABLE track_mappings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            track_key VARCHAR(512) UNIQUE NOT NULL,
+            filename VARCHAR(512),
+            loop_file_path VARCHAR(1024),
+            azuracast_song_id VARCHAR(128),
+            notes TEXT,
+            created_at TIMESTAMP,
+            last_played_at TIMESTAMP,
+            play_count INTEGER DEFAULT 0
+        )
+        """
+        )
+    )
+    db_session.commit()
+    yield
+    db_session.execute(text("DROP TABLE track_mappings"))
+    db_session.commit()
+
+
+@pytest.fixture
+def mapping_inserts(db_session):
+    """Collect the bulk-import INSERT statements sent for track_mappings."""
+    statements = []
+    engine = db_session.get_bind()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO track_mappings") and "ON CONFLICT" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_bulk_import_batches_rows(client, auth_headers, mappings_table, mapping_inserts):
+    lines = ["artist,title,filename"] + [f"Artist {i},Song {i},loop_{i}.mp4" for i in range(1001)]
+    files = {"file": ("mappings.csv", io.BytesIO("\n".join(lines).encode()), "text/csv")}
+
+    r = client.post("/api/v1/mappings/bulk-import", headers=auth_headers, files=files)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["imported_count"] == 1001
+    assert body["error_count"] == 0
+    # 1001 rows -> one full batch of 1000 plus one row
+    assert len(mapping_inserts) == 2
+
+
+def test_bulk_import_reports_duplicates_and_conflicts(
+    client, auth_headers, db_session, mappings_table, mapping_inserts
+):
+    db_session.execute(
+        text(
+            "INSERT INTO track_mappings (track_key, filename, loop_file_path, play_count) "
+            "VALUES ('Old - Song', 'old.mp4', '/srv/loops/old.mp4', 0)"
+        )
+    )
+    db_session.commit()
+
+    items = [
+        {"artist": "New", "title": "Song", "filename": "new.mp4", "azuracast_song_id": "42"},
+        {"artist": "Old", "title": "Song", "filename": "other.mp4"},
+        {"artist": "New", "title": "Song", "filename": "again.mp4"},
+    ]
+    files = {"file": ("mappings.json", io.BytesIO(json.dumps(items).encode()), "application/json")}
+
+    r = client.post("/api/v1/mappings/bulk-import", headers=auth_headers, files=files)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["imported_count"] == 1
+    assert body["error_count"] == 2
+    assert "Item 3: duplicate of Item 1 (New - Song)" in body["errors"]
+    assert "Item 2: mapping already exists (Old - Song)" in body["errors"]
+    assert len(mapping_inserts) == 1
+
+    rows = dict(db_session.execute(text("SELECT track_key, filename FROM track_mappings")).fetchall())
+    # The existing mapping is untouched and the first row for a duplicate key wins
+    assert rows == {"Old - Song": "old.mp4", "New - Song": "new.mp4"}
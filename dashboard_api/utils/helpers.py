@@ -1,5 +1,6 @@
 """Helper utility functions."""
 
+import json
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -38,8 +39,6 @@ def get_video_metadata(video_path: Path) -> Optional[dict]:
         if result.returncode != 0:
             return None
 
-        import json
-
         data = json.loads(result.stdout)
 
         # Extract video stream info
@@ -42,6 +42,7 @@ config: Optional[Config] = None
 config_fetcher: Optional[ConfigFetcher] = None
 ffmpeg_manager: Optional[FFmpegManager] = None
 track_mapper: Optional[TrackMapper] = None
+http_session: Optional[aiohttp.ClientSession] = None
 
 # Prometheus metrics
 metrics_registry = CollectorRegistry()
@@ -126,6 +127,22 @@ class ManualSwitchRequest(BaseModel):
     song_id: Optional[str] = Field(None, description="Optional song ID")
 
 
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps connections to AzuraCast alive between
+    health checks instead of opening a new connection pool per request.
+
+    Returns:
+        aiohttp.ClientSession: Shared client session.
+    """
+    global http_session
+
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession()
+    return http_session
+
+
 async def background_task_loop():
     """Background task to check control commands and update status."""
     logger.info("Starting background task loop...")
@@ -223,7 +240,7 @@ async def on_config_change(new_config: Config, changed_keys: list):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown."""
-    global config, config_fetcher, ffmpeg_manager, track_mapper
+    global config, config_fetcher, ffmpeg_manager, track_mapper, http_session
 
     # Startup
     logger.info("Starting metadata watcher service...")
@@ -321,8 +338,15 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 pass
 
+        if config_fetcher:
+            await config_fetcher.close()
+
         if ffmpeg_manager:
             await ffmpeg_manager.cleanup()
+
+        if http_session and not http_session.closed:
+            await http_session.close()
+        http_session = None
         logger.info("Service shut down complete")
 
 
@@ -463,13 +487,13 @@ async def health_check():
 
     # Check AzuraCast connectivity
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{config.azuracast_url}/api/status",
-                headers={"X-API-Key": config.azuracast_api_key},
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as response:
-                azuracast_reachable = response.status == 200
+        session = get_http_session()
+        async with session.get(
+            f"{config.azuracast_url}/api/status",
+            headers={"X-API-Key": config.azuracast_api_key},
+            timeout=aiohttp.ClientTimeout(total=5),
+        ) as response:
+            azuracast_reachable = response.status == 200
     except Exception as e:
         logger.warning(f"AzuraCast health check failed: {e}")
 
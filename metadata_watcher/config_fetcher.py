@@ -31,6 +31,20 @@ class ConfigFetcher:
         self.refresh_interval = refresh_interval
         self.current_config: Optional[Config] = None
         self._fetch_lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating it on first use.
+
+        The client is kept for the fetcher's lifetime so periodic refreshes
+        reuse the same connection pool.
+
+        Returns:
+            httpx.AsyncClient: Shared HTTP client.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
 
     async def fetch_config(self) -> Optional[Config]:
         """Fetch configuration from dashboard API.
@@ -40,26 +54,26 @@ class ConfigFetcher:
         """
         async with self._fetch_lock:
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    # Use internal service endpoint with API token auth
-                    response = await client.get(
-                        f"{self.dashboard_url}/api/v1/config/internal/export",
-                        headers={"Authorization": f"Bearer {self.api_token}"},
-                    )
+                client = self._get_client()
+                # Use internal service endpoint with API token auth
+                response = await client.get(
+                    f"{self.dashboard_url}/api/v1/config/internal/export",
+                    headers={"Authorization": f"Bearer {self.api_token}"},
+                )
 
-                    if response.status_code != 200:
-                        logger.error(f"Failed to fetch config: HTTP {response.status_code}")
-                        return None
+                if response.status_code != 200:
+                    logger.error(f"Failed to fetch config: HTTP {response.status_code}")
+                    return None
 
-                    data = response.json()
-                    settings = data.get("settings", {})
+                data = response.json()
+                settings = data.get("settings", {})
 
-                    # Build Config from dashboard settings
-                    config = self._build_config_from_settings(settings)
+                # Build Config from dashboard settings
+                config = self._build_config_from_settings(settings)
 
-                    logger.info("Successfully fetched configuration from dashboard")
-                    self.current_config = config
-                    return config
+                logger.info("Successfully fetched configuration from dashboard")
+                self.current_config = config
+                return config
 
             except httpx.RequestError as e:
                 logger.error(f"Error fetching config from dashboard: {e}")
@@ -68,6 +82,12 @@ class ConfigFetcher:
                 logger.error(f"Unexpected error fetching config: {e}", exc_info=True)
                 return None
 
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _build_config_from_settings(self, settings: dict) -> Config:
         """Build Config object from dashboard settings.
 
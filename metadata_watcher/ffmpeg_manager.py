@@ -298,7 +298,7 @@ class FFmpegManager:
 
             # Update restart tracking
             self.restart_attempts[track_key] = attempts + 1
-            self.last_restart_time[track_key] = time.time()
+            self.last_restart_time[track_key] = time.monotonic()
 
             logger.info(f"FFmpeg process spawned: PID {ffmpeg_process.pid}, log: {log_file}")
             return ffmpeg_process
@@ -509,7 +509,7 @@ class FFmpegManager:
         if track_key not in self.last_restart_time:
             return True
 
-        elapsed = time.time() - self.last_restart_time[track_key]
+        elapsed = time.monotonic() - self.last_restart_time[track_key]
         cooldown = self.config.restart_cooldown_seconds
 
         if elapsed < cooldown:
@@ -8,6 +8,7 @@ import logging
 import os
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 import httpx
 
@@ -21,25 +22,39 @@ class NginxPushManager:
         self.dashboard_url = dashboard_url.rstrip("/")
         self.api_token = api_token
         self.current_stream_key = None
+        # Reused across polls so the dashboard connection stays alive
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch_stream_key(self) -> str:
         """Fetch YouTube stream key from dashboard."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.dashboard_url}/api/v1/config/internal/export",
-                    headers={"Authorization": f"Bearer {self.api_token}"},
+            client = self._get_client()
+            response = await client.get(
+                f"{self.dashboard_url}/api/v1/config/internal/export",
+                headers={"Authorization": f"Bearer {self.api_token}"},
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                stream_key = (
+                    data.get("settings", {}).get("stream", {}).get("YOUTUBE_STREAM_KEY", "")
                 )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    stream_key = (
-                        data.get("settings", {}).get("stream", {}).get("YOUTUBE_STREAM_KEY", "")
-                    )
-                    return stream_key
-                else:
-                    logger.error(f"Failed to fetch config: HTTP {response.status_code}")
-                    return None
+                return stream_key
+            else:
+                logger.error(f"Failed to fetch config: HTTP {response.status_code}")
+                return None
 
         except Exception as e:
             logger.error(f"Error fetching stream key: {e}")
@@ -75,22 +90,25 @@ class NginxPushManager:
         """Main loop to check and update config."""
         logger.info(f"Starting nginx push manager (interval: {interval}s)")
 
-        while True:
-            try:
-                stream_key = await self.fetch_stream_key()
+        try:
+            while True:
+                try:
+                    stream_key = await self.fetch_stream_key()
 
-                if stream_key and stream_key != self.current_stream_key:
-                    logger.info("Stream key changed, updating nginx config...")
-                    success = await self.update_nginx_config(stream_key)
+                    if stream_key and stream_key != self.current_stream_key:
+                        logger.info("Stream key changed, updating nginx config...")
+                        success = await self.update_nginx_config(stream_key)
 
-                    if success:
-                        self.current_stream_key = stream_key
+                        if success:
+                            self.current_stream_key = stream_key
 
-                await asyncio.sleep(interval)
+                    await asyncio.sleep(interval)
 
-            except Exception as e:
-                logger.error(f"Error in push manager loop: {e}")
-                await asyncio.sleep(interval)
+                except Exception as e:
+                    logger.error(f"Error in push manager loop: {e}")
+                    await asyncio.sleep(interval)
+        finally:
+            await self.close()
 
 
 if __name__ == "__main__":
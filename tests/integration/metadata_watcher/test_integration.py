@@ -5,7 +5,6 @@ These tests verify the complete workflow from webhook to FFmpeg spawning.
 
 import pytest
 import asyncio
-import os
 import signal
 import time
 from pathlib import Path
@@ -22,7 +21,7 @@ from config import TrackMapperConfig
 
 
 @pytest.fixture
-def test_config(tmp_path):
+def test_config(tmp_path, monkeypatch):
     """Create a test configuration."""
     # Create test directories
     loops_path = tmp_path / "loops"
@@ -53,15 +52,11 @@ def test_config(tmp_path):
         "RESTART_COOLDOWN_SECONDS": "5",
     }
 
+    # monkeypatch restores any pre-existing values on teardown
     for key, value in env_vars.items():
-        os.environ[key] = value
+        monkeypatch.setenv(key, value)
 
-    config = Config.from_env()
-    yield config
-
-    # Cleanup
-    for key in env_vars:
-        os.environ.pop(key, None)
+    return Config.from_env()
 
 
 @pytest.fixture
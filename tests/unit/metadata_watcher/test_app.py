@@ -52,6 +52,28 @@ def mock_track_mapper():
     return mapper
 
 
+@pytest.fixture
+def mock_azuracast_session():
+    """Patch aiohttp.ClientSession with a session whose GETs return HTTP 200."""
+    with patch("metadata_watcher.app.aiohttp.ClientSession") as mock_session:
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock()
+
+        mock_get = Mock()
+        mock_get.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_get.__aexit__ = AsyncMock()
+
+        mock_session_instance = Mock()
+        mock_session_instance.closed = False
+        mock_session_instance.get.return_value = mock_get
+        mock_session_instance.close = AsyncMock()
+
+        mock_session.return_value = mock_session_instance
+        yield mock_session
+
+
 @pytest.fixture
 def client(mock_config, mock_ffmpeg_manager, mock_track_mapper):
     """Create a test client with mocked dependencies."""
@@ -172,33 +194,23 @@ class TestWebhookEndpoint:
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
-    def test_health_check_success(self, client):
+    def test_health_check_success(self, client, mock_azuracast_session):
         """Test health check when everything is healthy."""
-        with patch("metadata_watcher.app.aiohttp.ClientSession") as mock_session:
-            # Mock successful AzuraCast response
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock()
-
-            mock_get = Mock()
-            mock_get.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_get.__aexit__ = AsyncMock()
+        response = client.get("/health")
 
-            mock_session_instance = Mock()
-            mock_session_instance.get.return_value = mock_get
-            mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session_instance.__aexit__ = AsyncMock()
+        assert response.status_code == 200
+        data = response.json()
+        assert data["service"] == "metadata-watcher"
+        assert data["azuracast_reachable"] is True
+        assert data["ffmpeg_status"] == "running"
 
-            mock_session.return_value = mock_session_instance
+    def test_health_check_reuses_session(self, client, mock_azuracast_session):
+        """Test that repeated health checks share one HTTP session."""
+        client.get("/health")
+        client.get("/health")
 
-            response = client.get("/health")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["service"] == "metadata-watcher"
-            assert data["azuracast_reachable"] is True
-            assert data["ffmpeg_status"] == "running"
+        assert mock_azuracast_session.call_count == 1
+        assert mock_azuracast_session.return_value.get.call_count == 2
 
     def test_health_check_azuracast_unreachable(self, client):
         """Test health check when AzuraCast is unreachable."""
@@ -0,0 +1,70 @@
+"""Unit tests for ConfigFetcher."""
+
+import pytest
+from unittest.mock import Mock, patch, AsyncMock
+
+from metadata_watcher.config_fetcher import ConfigFetcher
+
+
+@pytest.fixture
+def mock_http_client():
+    """Patch httpx.AsyncClient with a client whose fetches return HTTP 503."""
+    with patch("metadata_watcher.config_fetcher.httpx.AsyncClient") as mock_client_cls:
+        mock_response = Mock()
+        mock_response.status_code = 503
+
+        mock_client = Mock()
+        mock_client.is_closed = False
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.aclose = AsyncMock()
+
+        mock_client_cls.return_value = mock_client
+        yield mock_client_cls
+
+
+@pytest.fixture
+def fetcher():
+    """Create a ConfigFetcher pointed at a test dashboard."""
+    return ConfigFetcher("http://dashboard.test:9001/", "test-token")
+
+
+class TestConfigFetcherClient:
+    """Test HTTP client reuse across config fetches."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_config_reuses_client(self, fetcher, mock_http_client):
+        """Test that repeated fetches share one HTTP client."""
+        await fetcher.fetch_config()
+        await fetcher.fetch_config()
+
+        assert mock_http_client.call_count == 1
+        mock_client = mock_http_client.return_value
+        assert mock_client.get.await_count == 2
+        mock_client.get.assert_awaited_with(
+            "http://dashboard.test:9001/api/v1/config/internal/export",
+            headers={"Authorization": "Bearer test-token"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self, fetcher, mock_http_client):
+        """Test that close() closes the client and a later fetch builds a new one."""
+        await fetcher.fetch_config()
+        mock_client = mock_http_client.return_value
+
+        await fetcher.close()
+
+        mock_client.aclose.assert_awaited_once()
+        assert fetcher._client is None
+
+        await fetcher.fetch_config()
+
+        assert mock_http_client.call_count == 2
+        assert fetcher._client is mock_client
+
+    @pytest.mark.asyncio
+    async def test_close_without_client(self, fetcher, mock_http_client):
+        """Test that close() is a no-op before any fetch."""
+        await fetcher.close()
+
+        mock_http_client.assert_not_called()
+        assert fetcher._client is None
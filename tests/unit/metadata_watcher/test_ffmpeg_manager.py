@@ -228,7 +228,7 @@ class TestFFmpegManager:
         import time
 
         track_key = "test - track"
-        manager.last_restart_time[track_key] = time.time()
+        manager.last_restart_time[track_key] = time.monotonic()
 
         assert manager._check_restart_cooldown(track_key) is False
 
@@ -237,7 +237,7 @@ class TestFFmpegManager:
         import time
 
         track_key = "test - track"
-        manager.last_restart_time[track_key] = time.time() - 100  # 100 seconds ago
+        manager.last_restart_time[track_key] = time.monotonic() - 100  # 100 seconds ago
         manager.restart_attempts[track_key] = 1
 
         result = manager._check_restart_cooldown(track_key)
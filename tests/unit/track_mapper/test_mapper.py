@@ -2,7 +2,7 @@
 
 import os
 import tempfile
-from datetime import datetime
+import time
 from unittest.mock import Mock, patch
 import pytest
 
@@ -142,7 +142,7 @@ class TestTrackMapper:
         track_key = "artist - title"
 
         # Add to cache with old timestamp
-        old_timestamp = datetime.now().timestamp() - 7200  # 2 hours ago
+        old_timestamp = time.monotonic() - 7200  # 2 hours ago
         mapper._cache[track_key] = (temp_loop_file, old_timestamp)
 
         # Mock database response
@@ -233,7 +233,7 @@ class TestTrackMapper:
         track_key = "artist - title"
 
         # Add to cache first
-        mapper._cache[track_key] = ("/path/to/file.mp4", datetime.now().timestamp())
+        mapper._cache[track_key] = ("/path/to/file.mp4", time.monotonic())
 
         # Mock successful delete
         mock_result = Mock()
@@ -409,6 +409,21 @@ class TestTrackMapper:
         # Add one more, should evict oldest
         mapper._add_to_cache("new_track", temp_loop_file)
         assert len(mapper._cache) == mapper._cache_max_size
+        assert "track0" not in mapper._cache
+
+    def test_cache_eviction_least_recently_used(self, mapper, temp_loop_file):
+        """Test that a cache hit protects an entry from eviction"""
+        for i in range(mapper._cache_max_size):
+            mapper._add_to_cache(f"track{i}", temp_loop_file)
+
+        # Touch the oldest entry so track1 becomes least recently used
+        assert mapper._get_from_cache("track0") == temp_loop_file
+
+        mapper._add_to_cache("new_track", temp_loop_file)
+
+        assert "track0" in mapper._cache
+        assert "track1" not in mapper._cache
+        assert "new_track" in mapper._cache
 
     def test_clear_cache(self, mapper, temp_loop_file):
         """Test clearing cache"""
@@ -5,8 +5,9 @@ Maps tracks to video loop files with database backing and LRU caching.
 
 import logging
 import os
-from datetime import datetime
 import random
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
@@ -51,7 +52,8 @@ class TrackMapper:
         config.validate()
         self.config = config
         self.engine: Engine = self._create_engine()
-        self._cache: Dict[str, Tuple[str, float]] = {}  # track_key -> (path, timestamp)
+        # track_key -> (path, monotonic timestamp), ordered from least to most recently used
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
         self._cache_max_size = config.cache_size
         self._cache_ttl = config.cache_ttl_seconds
 
@@ -535,8 +537,9 @@ class TrackMapper:
         """
         if track_key in self._cache:
             path, timestamp = self._cache[track_key]
-            age = datetime.now().timestamp() - timestamp
+            age = time.monotonic() - timestamp
             if age < self._cache_ttl:
+                self._cache.move_to_end(track_key)
                 return path
             else:
                 # Expired, remove from cache
@@ -546,18 +549,20 @@ class TrackMapper:
     def _add_to_cache(self, track_key: str, loop_path: str) -> None:
         """Add loop path to cache with timestamp.
 
-        Implements simple LRU eviction when cache is full.
+        Implements LRU eviction when cache is full. The least recently used
+        entry sits at the front of the OrderedDict, so eviction is O(1).
 
         Args:
             track_key: Normalized track key
             loop_path: Loop file path
         """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            oldest_key = min(self._cache, key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
+        if track_key in self._cache:
+            self._cache.move_to_end(track_key)
+        elif len(self._cache) >= self._cache_max_size:
+            # Evict least recently used entry
+            self._cache.popitem(last=False)
 
-        self._cache[track_key] = (loop_path, datetime.now().timestamp())
+        self._cache[track_key] = (loop_path, time.monotonic())
 
     def _remove_from_cache(self, track_key: str) -> None:
         """Remove entry from cache.